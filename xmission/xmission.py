@@ -2,28 +2,152 @@
 # -*- coding: utf-8 -*-
 
 import gi
-import gc
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, Gdk, GLib, Gio, GObject
+from gi.repository import Gtk, Gdk, GLib, Gio
 import os
-import subprocess
-import time
+import mmap
 import logging
 import xmi
-import datetime
 import sys
-import pprint
 from pathlib import Path
-import tempfile
+import atexit
+import shutil
 import re
-import argparse
 import threading
-import multiprocessing
+import queue
+import concurrent.futures
+import functools
+import time
 
 running_folder = Path(Path(__file__).parent)
 
 UI_FILE = running_folder / "ui/xmission.glade"
 
+# How many rows get appended to the file list per idle callback
+LIST_BATCH_SIZE = 500
+
+# Digit splitter for natural sorting, compiled once, with the split
+# method pre-bound so sort keys skip the attribute lookup per call
+NATKEY_RE = re.compile(r'(\d+)')
+_nat_split = NATKEY_RE.split
+
+# Column indexes of file_list_store, for insert_with_valuesv
+FILE_LIST_COLUMNS = list(range(8))
+
+# Units for sizeof_fmt, built once instead of per call
+SIZE_UNITS = ('bytes', 'kB', 'MB', 'GB', 'TB', 'PB', 'EB', 'ZB')
+
+# Label template for the extract window
+EXTRACT_TEMPLATE = "Extracting {} to {}"
+
+# Month names for _fmt_iso, avoiding a strftime round trip per row
+MONTHS = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+          'August', 'September', 'October', 'November', 'December')
+
+
+def _fmt_iso(s):
+    """Format an ISO-8601 timestamp like '%-d %B %Y, %H:%S' by slicing.
+
+    The timestamps from xmi are fixed-width ISO strings, so slicing the
+    fields out directly is much cheaper than datetime.fromisoformat()
+    followed by strftime() for every row in the file list.
+    """
+    return "{} {} {}, {}:{}".format(
+            int(s[8:10]), MONTHS[int(s[5:7]) - 1], s[0:4], s[11:13], s[17:19])
+
+
+@functools.lru_cache(maxsize=4096)
+def sizeof_fmt(num):
+    num = int(num)
+    if num <= 0:
+        return f"0.0 {SIZE_UNITS[0]}"
+    # bit_length picks the unit bucket directly instead of a
+    # division loop per call
+    unit = min((num.bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+    return f"{num / (1 << (unit * 10)):3.1f} {SIZE_UNITS[unit]}"
+
+
+# The icon theme rarely changes at runtime; look it up once on first
+# use, and drop the cached pixbufs if the user does switch themes
+_icon_theme = None
+
+
+def _get_icon_theme():
+    global _icon_theme
+    if _icon_theme is None:
+        _icon_theme = Gtk.IconTheme.get_default()
+        _icon_theme.connect("changed", lambda theme: mime_icon.cache_clear())
+    return _icon_theme
+
+
+# The mime_* helpers are pure functions of the mime type, and a PDS
+# with thousands of members rarely has more than a handful of distinct
+# mimetypes, so cache the Gio/IconTheme round trips
+
+@functools.lru_cache(maxsize=256)
+def mime_desc(mime_type):
+    giotype = Gio.content_type_from_mime_type(mime_type)
+    if 'directory' in mime_type:
+        giotype = Gio.content_type_from_mime_type("folder")
+    return Gio.content_type_get_description(giotype)
+
+
+@functools.lru_cache(maxsize=256)
+def mime_icon(mime_type, size=32):
+    if 'directory' in mime_type:
+        mime_type = "folder"
+    gicon = Gio.content_type_get_icon(mime_type)
+    gmimetypes = gicon.get_names()
+    # USE_BUILTIN lets the theme hand back its compiled-in pixbufs
+    # instead of hitting the disk for stock icons
+    flags = Gtk.IconLookupFlags.FORCE_SIZE | Gtk.IconLookupFlags.USE_BUILTIN
+    try:
+        img = _get_icon_theme().load_icon(gmimetypes[0], size, flags)
+    except gi.repository.GLib.Error:
+        img = _get_icon_theme().load_icon(gmimetypes[1], size, flags)
+    return img
+
+
+@functools.lru_cache(maxsize=256)
+def mime_exec(mime_type):
+    giotype = Gio.content_type_from_mime_type(mime_type)
+    app_infos = Gio.app_info_get_all_for_type(giotype)
+    return app_infos[0].get_executable()
+
+
+@functools.lru_cache(maxsize=256)
+def mime_app_name(mime_type):
+    giotype = Gio.content_type_from_mime_type(mime_type)
+    app_infos = Gio.app_info_get_all_for_type(giotype)
+    return app_infos[0].get_name()
+
+
+def _extract_one(xmi_filename, opts, parent, filenames):
+    """Extract a dataset, or members of one dataset, in a worker process.
+
+       EBCDIC conversion is CPU bound python, so extractions are fanned
+       out to processes; the live XMIT object can't be pickled, so each
+       worker rebuilds a lightweight one from the archive path and the
+       current settings. Parsing the archive is the expensive part, so
+       each worker handles a whole dataset (or all selected members of
+       one) per parse. Returns the number of files written.
+    """
+    XMI = xmi.XMIT(unnum=opts['unnum'], encoding=opts['codepage'],
+            force_convert=opts['force'], binary=opts['binary']
+            )
+    XMI.set_filename(xmi_filename)
+    XMI.open()
+    XMI.set_overwrite(opts['overwrite'])
+    XMI.set_quiet()
+    XMI.set_modify(opts['modify'])
+    XMI.set_output_folder(opts['output_folder'])
+    if not parent:
+        XMI.unload_pds(filenames)
+        return len(XMI.get_members(filenames)) or 1
+    for filename in filenames:
+        XMI.unload_file(parent, filename)
+    return len(filenames)
+
 __version__ = '0.9.5'
 __author__ = 'Philip Young'
 __license__ = "GPL"
@@ -53,7 +177,7 @@ class XMIssion:
         self.modify = True
         logger.setLevel(self.loglevel)
         if filename is not None:
-            logger.debug("XMIssion running with the following options: filename: {}".format(filename))
+            logger.debug("XMIssion running with the following options: filename: %s", filename)
         else:
             logger.debug("XMIssion running")
 
@@ -96,10 +220,46 @@ class XMIssion:
         self.file_name = filename
         self.has_message = False
         self.selected_folder = None
+        self.running = False
+        self.working_window = None
+        self.progress_bar = None
+        # One long-lived loader thread fed from a queue; submitting to
+        # it is much cheaper than spawning a fresh Thread per file open
+        # and a single worker keeps loads naturally serialized. It has
+        # to be a daemon thread: executor workers get joined at
+        # interpreter exit, which would make quitting mid-parse hang
+        # until the parse finished
+        self._load_queue = queue.Queue()
+        threading.Thread(target=self._load_worker, daemon=True).start()
+        self._settings_signature = None
+        self._extract_generation = 0
+        # Bumped whenever the file list is (re)filled, so idle-batched
+        # fills from a previous view stop appending stale rows
+        self._fill_generation = 0
+        self._info_cache = {}
+        self._decode_cache = {}
+        self._counts = None
+        self._file_mtime = None
+        self._archive_kind = "Unknown"
+        self._path = None
+        self._basename = None
+        self._parent_abs = None
         self.XMI = xmi.XMIT(loglevel=self.loglevel,
                 unnum=self.unnum, encoding=self.codepage,
                 force_convert=self.force, binary=self.binary
                 )
+        # The supported codecs never change at runtime; sort and dedupe
+        # them once instead of on every submenu build
+        self._sorted_codecs = list(dict.fromkeys(sorted(self.XMI.get_codecs(), key=self.natural_key)))
+
+        # Conversion radio settings keyed on the widget name, which is
+        # stable under localization (unlike the label):
+        # name -> (translate, binary, force, unnum_sensitive, status)
+        self._convert_modes = {
+            'convert_guess': (True, False, False, True, "Converting based on mimetype"),
+            'convert_none': (False, True, False, False, "File conversion disabled"),
+            'convert_all': (False, False, True, True, "Converting all file to UTF-8"),
+        }
 
         self.builder = Gtk.Builder()
         self.builder.add_from_file(str(UI_FILE.resolve()))
@@ -114,28 +274,153 @@ class XMIssion:
 
         self.msg_button = self.builder.get_object('xmi_view_message')
 
+        # Builder lookups walk the builder's object set; memoize them so
+        # per-event handlers pay one dict hit instead
+        self._widgets = {}
+
+        # These windows are shown without a nested main loop (no .run()),
+        # so a titlebar close needs to hide rather than destroy them
+        for window_name in ('xmi_message_window', 'xmi_info_window',
+                            'tape_info_window', 'about_xmission'):
+            self._widget(window_name).connect("delete-event", lambda w, e: w.hide() or True)
 
+
+        self._bind_widgets()
         self.make_codecs_submenu()
         self.main_window.show_all()
 
         if filename is not None:
-            logger.debug("Reading file: {}".format(filename))
-            with open(filename, 'rb') as x:
-                self.file_data = x.read()
-            logger.debug("Total bytes: {}".format(len(self.file_data)))
-            self.loading_file()
+            # Map the file on a worker thread so the window is on screen
+            # immediately; loading_file is scheduled once the data is
+            # ready
+            def _async_load():
+                logger.debug("Reading file: %s", filename)
+                try:
+                    self.file_data = self._map_file(filename)
+                except Exception as err:
+                    # Nothing downstream will ever see this failure, so
+                    # report it here and put up the usual error dialog
+                    logger.error("Unable to read %s: %s", filename, err)
+                    GLib.idle_add(self._show_open_error, err)
+                    return
+                logger.debug("Total bytes: %s", len(self.file_data))
+                GLib.idle_add(self.loading_file)
+
+            self._load_queue.put(_async_load)
 
         #self.show_files()
 
+    def _decoded(self, pds, member):
+        # Opening the same member twice re-ran the EBCDIC conversion
+        # from scratch; cache the decoded payload against the settings
+        # that affect it. Entries age out oldest-first past 64 so
+        # MB-scale members can't pile up.
+        key = (pds, member, self.codepage, self.unnum, self.force, self.binary)
+        data = self._decode_cache.get(key)
+        if data is None:
+            if pds:
+                data = self.XMI.get_member_decoded(pds, member)
+            else:
+                data = self.XMI.get_seq_decoded(member)
+            if len(self._decode_cache) >= 64:
+                self._decode_cache.pop(next(iter(self._decode_cache)))
+            self._decode_cache[key] = data
+        return data
+
+    def _widget(self, name):
+        widget = self._widgets.get(name)
+        if widget is None:
+            widget = self._widgets[name] = self.builder.get_object(name)
+        return widget
+
+    def _bind_widgets(self):
+        # The info and member panels set a dozen-plus fields per event;
+        # bind those widgets to attributes once so each field access is
+        # a plain attribute load instead of a string-keyed builder lookup
+        for name in (
+                'member_alias', 'member_icon', 'member_info',
+                'member_recfm', 'member_lrecl', 'member_type',
+                'member_siz', 'member_modified', 'member_owner',
+                'member_created', 'member_version',
+                'tape_file_icon', 'tape_file_info_name',
+                'tape_file_info_type', 'tape_file_info_created',
+                'tape_file_info_expires', 'tape_file_info_system_code',
+                'tape_file_info_job_id', 'tape_file_info_size',
+                'tape_file_info_num_files', 'tape_file_info_lrecl',
+                'tape_file_info_recfm', 'tape_file_info_owner',
+                'tape_file_info_user_label',
+                'info_filename', 'info_location', 'info_created',
+                'info_pds', 'info_size', 'info_num_files',
+                'info_from_node', 'info_from_user', 'info_to_node',
+                'info_to_user', 'info_type', 'info_messages',
+                'tape_info_filename', 'tape_info_location',
+                'tape_info_size', 'tape_info_type',
+                'tape_info_num_files', 'tape_info_owner',
+                'tape_info_volume', 'tape_info_created',
+                ):
+            setattr(self, 'w_' + name, self.builder.get_object(name))
+
+    def _map_file(self, filename):
+        # mmap instead of read(): zero copy and demand paged, so a
+        # gigabyte tape no longer doubles resident memory or stalls
+        # startup on one giant read. mmap satisfies the buffer protocol
+        # that xmi.XMIT expects.
+        self._close_map()
+        fd = os.open(filename, os.O_RDONLY)
+        try:
+            self._file_mtime = os.fstat(fd).st_mtime
+            return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+
+    def _close_map(self):
+        if isinstance(self.file_data, mmap.mmap):
+            try:
+                self.file_data.close()
+            except BufferError:
+                # something still holds a view; let GC unmap it later
+                pass
+
+    def _info(self, filename):
+        # get_file_info_simple re-reads the metadata every call, so keep
+        # the result around until a new archive is loaded
+        info = self._info_cache.get(filename)
+        if info is None:
+            info = self._info_cache[filename] = self.XMI.get_file_info_simple(filename)
+            # Pre-render the display timestamp so the list fill is a
+            # plain set_text call
+            if info.get('modified'):
+                info['modified_disp'] = _fmt_iso(info['modified'])
+        return info
+
+    def get_counts(self):
+        # The object count and total size only change when a new archive
+        # is parsed, so walk the member list once instead of twice for
+        # every status line
+        if self._counts is None:
+            self._counts = (self.XMI.get_num_files(), self.XMI.get_total_size())
+        return self._counts
+
     def update_status(self, message):
         self.statusbar.pop(self.context_id)
         self.statusbar.push(self.context_id, message)
 
     def make_codecs_submenu(self):
-        codecs = list(dict.fromkeys(sorted(self.XMI.get_codecs(), key=self.natural_key)))
-        logger.debug("Current Codec: {} Total supported EBCDIC code pages: {}".format(self.XMI.get_codec(), len(codecs)))
-
+        # Creating a MenuItem per EBCDIC code page is startup-visible
+        # work; hang an empty submenu here and fill it the first time
+        # the user actually opens it
+        self._codecs_populated = False
         codec_menu = Gtk.Menu()
+        codec_menu.connect("show", self._populate_codecs_once)
+        self._widget("ebcdic_encoding").set_submenu(codec_menu)
+
+    def _populate_codecs_once(self, codec_menu):
+        if self._codecs_populated:
+            return
+        self._codecs_populated = True
+        codecs = self._sorted_codecs
+        logger.debug("Current Codec: %s Total supported EBCDIC code pages: %s", self.XMI.get_codec(), len(codecs))
+
         for codec in codecs:
             codec_menu_item = Gtk.MenuItem(label=codec)
 
@@ -145,7 +430,7 @@ class XMIssion:
                 label.set_markup(codec)
             codec_menu_item.connect("activate", self.change_codec, codec)
             codec_menu.append(codec_menu_item)
-        self.builder.get_object("ebcdic_encoding").set_submenu(codec_menu)
+        codec_menu.show_all()
 
     def change_codec(self, button, name):
         if "<b>" in name:
@@ -165,23 +450,39 @@ class XMIssion:
 
     def make_temp_folder(self):
         if not self.tempfolder:
-            temp_prefix = GLib.get_user_cache_dir()
-            logger.debug("Cache folder: {}".format(temp_prefix))
-            self.tempfolder = tempfile.TemporaryDirectory(prefix="{}/".format(temp_prefix))
-        return self.tempfolder.name
+            # One stable per-session folder instead of a fresh
+            # TemporaryDirectory (whose finalizer also rmtrees
+            # synchronously at shutdown)
+            cache_dir = Path(GLib.get_user_cache_dir()) / "xmission" / "session-{}".format(os.getpid())
+            logger.debug("Cache folder: %s", cache_dir)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            atexit.register(shutil.rmtree, cache_dir, ignore_errors=True)
+            self.tempfolder = str(cache_dir)
+        return self.tempfolder
 
     def open_json(self, button):
         file_location = "{}/{}".format(self.make_temp_folder() , "file.json")
-        json_exec = self.mime_exec("text/plain")
-        json_app_name = self.mime_app_name("text/plain")
-        logger.debug("Opening {} with {} ({})".format("JSON", json_exec, json_app_name))
+        json_exec = mime_exec("text/plain")
+        json_app_name = mime_app_name("text/plain")
+        logger.debug("Opening %s with %s (%s)", "JSON", json_exec, json_app_name)
         giotype = Gio.content_type_from_mime_type("text/plain")
         #default_app = Gio.app_info_get_all_for_type("text/plain")[0]
-        logger.debug("Extracting temp file to: {}".format(file_location))
+        logger.debug("Extracting temp file to: %s", file_location)
         json = self.XMI.get_xmit_json()
 
-        with open(file_location, 'w') as json_temp_file:
-                json_temp_file.write(json)
+        # xmi-reader only hands back the serialized string, so the best
+        # we can do is write the encoded bytes in one syscall instead of
+        # pushing tens of MB through the buffered text layer
+        payload = json.encode('utf-8')
+        fd = os.open(file_location, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            # write(2) can come up short (and caps out around 2 GB per
+            # call), so keep writing until the payload is flushed
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
 
         member_gfile = Gio.File.new_for_path(file_location)
         uri = member_gfile.get_uri()
@@ -203,12 +504,14 @@ class XMIssion:
     def show_message(self, button):
         logger.debug("Displaying XMI message")
         #self.XMI.pprint()
-        self.message_window = self.builder.get_object('xmi_message_window')
-        self.message_text_buffer = self.builder.get_object('xmi_message_buffer')
-        self.message_text_buffer.set_text(self.XMI.get_message(), len(self.XMI.get_message()))
+        self.message_window = self._widget('xmi_message_window')
+        self.message_text_buffer = self._widget('xmi_message_buffer')
+        # get_message decodes the message each call; fetch it once for
+        # both the content and the length
+        message = self.XMI.get_message()
+        self.message_text_buffer.set_text(message, len(message))
         self.message_window.set_transient_for(self.main_window)
         self.message_window.show()
-        self.message_window.run()
 
     def close_message(self, button):
         logger.debug("Closing Message Window")
@@ -218,16 +521,15 @@ class XMIssion:
         logger.debug("Displaying XMI Info")
         #self.XMI.pprint()
         if self.XMI.has_xmi():
-            self.info_window = self.builder.get_object('xmi_info_window')
+            self.info_window = self._widget('xmi_info_window')
         else:
-            self.info_window = self.builder.get_object('tape_info_window')
+            self.info_window = self._widget('tape_info_window')
         self.info_window.set_transient_for(self.main_window)
         self.info_window.show()
-        self.info_window.run()
 
     def file_info(self, button):
         selected = self.get_selected()
-        logger.debug("Selected: {}".format(selected))
+        logger.debug("Selected: %s", selected)
         if len(selected) == 0:
             self.show_info(None)
         else:
@@ -239,10 +541,9 @@ class XMIssion:
 
     def show_about(self, button):
         logger.debug("Displaying About window")
-        self.about_window = self.builder.get_object('about_xmission')
+        self.about_window = self._widget('about_xmission')
         self.about_window.set_transient_for(self.main_window)
         self.about_window.show()
-        self.about_window.run()
 
     def close_about(self, button, w):
         logger.debug("Closing About Window")
@@ -252,10 +553,8 @@ class XMIssion:
         objects_selected = 0
         size = 0
 
-        msg = "{} objects ({})".format(
-            self.XMI.get_num_files(),
-            self.sizeof_fmt(self.XMI.get_total_size())
-            )
+        num_files, total_size = self.get_counts()
+        msg = "{} objects ({})".format(num_files, sizeof_fmt(total_size))
         selected = ", {total} selected ({size})"
 
         for files in self.get_selected():
@@ -264,24 +563,24 @@ class XMIssion:
             pds = files[1]
 
             if not pds:
-                logger.debug("{} Selected".format(filename))
+                logger.debug("%s Selected", filename)
                 if self.XMI.is_sequential(filename):
                     size += self.XMI.get_dataset_size(filename)
                 objects_selected += 1
             else:
-                logger.debug("{} Selected ({})".format(filename, pds))
+                logger.debug("%s Selected (%s)", filename, pds)
                 size += self.XMI.get_member_size(pds, filename.split('.')[0])
                 objects_selected += 1
 
         if objects_selected > 0:
-            self.update_status(msg + selected.format(total=objects_selected,size=self.sizeof_fmt(size)))
+            self.update_status(msg + selected.format(total=objects_selected,size=sizeof_fmt(size)))
         else:
             self.update_status(msg)
 
     def show_extract_folder(self, button):
         if not self.selected_folder:
             return
-        logger.debug("Opening extract folder {}".format(self.selected_folder))
+        logger.debug("Opening extract folder %s", self.selected_folder)
         member_gfile = Gio.File.new_for_path(self.selected_folder)
         uri = member_gfile.get_uri()
         timestamp = Gtk.get_current_event_time()
@@ -301,30 +600,40 @@ class XMIssion:
 
     def double_click(self, widget, row, col):
         model = widget.get_model()
-        logger.debug("Opening: {} Type: {}".format(model[row][1], model[row][3]))
+        logger.debug("Opening: %s Type: %s", model[row][1], model[row][3])
         self.update_location(location="/{}/".format(model[row][1]))
         filename = model[row][6]
         parent = model[row][7]
 
         if not parent and self.XMI.is_pds(filename):
-            logger.debug("Opening PDS {}".format(filename))
-            self.file_store_treeview.clear()
+            logger.debug("Opening PDS %s", filename)
+            # Same trick as go_home: detach the model and disable
+            # sorting so thousands of member rows go in without a
+            # resort/redraw each
+            self._fill_generation += 1
+            treeview = self._widget('file_selection').get_tree_view()
+            store = self.file_store_treeview
+            sort_settings = store.get_sort_column_id()
+            treeview.set_model(None)
+            store.set_default_sort_func(lambda *args: 0)
+            store.set_sort_column_id(Gtk.TREE_SORTABLE_UNSORTED_SORT_COLUMN_ID, Gtk.SortType.ASCENDING)
+            store.clear()
             for m in self.XMI.get_members(filename):
                 info = self.XMI.get_member_info(filename, m)
                 self.list_store_append(m, info, parent=filename)
+            if sort_settings[0] is not None:
+                store.set_sort_column_id(*sort_settings)
+            treeview.set_model(store)
         else:
             self.extract_and_open(filename, parent)
 
 
     def list_store_append(self, filename, info, parent=None):
-        info_log = "member: {} ".format(filename)
-        for i in info:
-            info_log += " | {}: {}".format(i, info[i])
-        logger.debug(info_log)
-        img = self.mime_icon(info['mimetype'])
-        desc = self.mime_desc(info['mimetype'])
+        logger.debug("member: %s info: %s", filename, info)
+        img = mime_icon(info['mimetype'])
+        desc = mime_desc(info['mimetype'])
         if 'modified' in info and info['modified']:
-            file_last_modified = datetime.datetime.fromisoformat(info['modified']).strftime("%-d %B %Y, %H:%S")
+            file_last_modified = info.get('modified_disp') or _fmt_iso(info['modified'])
         else:
             file_last_modified = ''
         if 'owner' in info:
@@ -340,9 +649,14 @@ class XMIssion:
         if "alias" in info:
             file_name_w_ext += "*"
 
-        self.file_store_treeview.append([img,  # file_icon
+        # insert_with_valuesv sets every column in one call instead of
+        # append + per-column set_value
+        self.file_store_treeview.insert_with_valuesv(
+                                        -1,
+                                        FILE_LIST_COLUMNS,
+                                        [img,  # file_icon
                                         file_name_w_ext,  # file_name
-                                        self.sizeof_fmt(info['size']),  # file_size
+                                        sizeof_fmt(info['size']),  # file_size
                                         desc,  # file_type
                                         file_last_modified,  # file_modify
                                         owner,  # file_owner
@@ -350,33 +664,6 @@ class XMIssion:
                                         parent])  # parent_name
 
 
-    def mime_desc(self,mime_type):
-        giotype = Gio.content_type_from_mime_type(mime_type)
-        if 'directory' in mime_type:
-            giotype = Gio.content_type_from_mime_type("folder")
-        return Gio.content_type_get_description(giotype)
-
-    def mime_icon(self, mime_type, size=32):
-        if 'directory' in mime_type:
-            mime_type = "folder"
-        gicon = Gio.content_type_get_icon(mime_type)
-        gmimetypes = gicon.get_names()
-        try:
-            img = Gtk.IconTheme.get_default().load_icon(gmimetypes[0], size, Gtk.IconLookupFlags.FORCE_SIZE)
-        except gi.repository.GLib.Error:
-            img = Gtk.IconTheme.get_default().load_icon(gmimetypes[1], size, Gtk.IconLookupFlags.FORCE_SIZE)
-        return img
-
-    def mime_exec(self, mime_type):
-        giotype = Gio.content_type_from_mime_type(mime_type)
-        app_infos = Gio.app_info_get_all_for_type(giotype)
-        return app_infos[0].get_executable()
-
-    def mime_app_name(self, mime_type):
-        giotype = Gio.content_type_from_mime_type(mime_type)
-        app_infos = Gio.app_info_get_all_for_type(giotype)
-        return app_infos[0].get_name()
-
     def open_file(self, button):
         logger.debug("Open File Button Pressed")
         dialog = Gtk.FileChooserDialog(
@@ -421,55 +708,38 @@ class XMIssion:
         dialog.show()
 
     def change_radio_convert(self, button):
-        convert_widget = self._resolve_radio(self.builder.get_object("convert_guess"))
-        convert_type = button.get_label()
-        logger.debug("Convert type changed to: {}".format(convert_type))
-        unnum = self.builder.get_object("unnum")
-        print(button.get_active())
         if not button.get_active():
             return
-        print("HOW ARE WE HERE?", button.get_label())
-
-        if convert_type == "Convert":
-            self.translate = True
-            self.force = False
-            self.binary = False
-            unnum.set_sensitive(True)
-            self.update_status("Converting based on mimetype")
-            self.builder.get_object("ebcdic_encoding").set_sensitive(True)
-            self.refresh_file()
-        elif convert_type == "Do not convert":
-            self.translate = False
-            self.binary = True
-            self.force = False
+        name = Gtk.Buildable.get_name(button)
+        logger.debug("Convert type changed to: %s", name)
+        self.translate, self.binary, self.force, unnum_sensitive, status = self._convert_modes[name]
+        unnum = self._widget("unnum")
+        unnum.set_sensitive(unnum_sensitive)
+        self._widget("ebcdic_encoding").set_sensitive(unnum_sensitive)
+        self.update_status(status)
+        if name == 'convert_none':
             self.unnum = False
-            self.update_status("File conversion disabled")
-            unnum.set_sensitive(False)
-            self.builder.get_object("ebcdic_encoding").set_sensitive(False)
             # No need to refresh, unnum will do it
             if unnum.get_active():
                 unnum.set_active(False)
-        elif convert_type == "Convert all to UTF-8":
-            self.binary = False
-            self.force = True
-            self.translate = False
-            unnum.set_sensitive(True)
-            self.update_status("Converting all file to UTF-8")
-            self.builder.get_object("ebcdic_encoding").set_sensitive(True)
+        else:
             self.refresh_file()
 
     def extract(self, button):
+        # This handler hits the widget cache a dozen-plus times; a
+        # local alias turns each into a plain fast-local call
+        w = self._widget
         selected_items = self.get_selected()
-        extract_radio = self.builder.get_object("extract_selected")
+        extract_radio = w("extract_selected")
         if len(selected_items) == 0:
             extract_radio.set_sensitive(False)
-            #self.builder.get_object("extract_create_dir").set_sensitive(False)
+            #w("extract_create_dir").set_sensitive(False)
         else:
             extract_radio.set_sensitive(True)
             extract_radio.set_active(True)
-            #self.builder.get_object("extract_create_dir").set_sensitive(True)
+            #w("extract_create_dir").set_sensitive(True)
 
-        dialog = self.builder.get_object("dialog_extract")
+        dialog = w("dialog_extract")
         dialog.set_transient_for(self.main_window)
 
         dialog.set_local_only(False)
@@ -477,7 +747,7 @@ class XMIssion:
         response_id = dialog.run()
         if response_id == Gtk.ResponseType.OK:
             selected_folder = dialog.get_filename()
-            logger.debug("Extract to folder name: {}".format(selected_folder))
+            logger.debug("Extract to folder name: %s", selected_folder)
         elif response_id == Gtk.ResponseType.CANCEL:
             logger.debug("File open cancelled")
             dialog.hide()
@@ -487,116 +757,169 @@ class XMIssion:
             dialog.hide()
             return
 
-        files_or_all = self._resolve_radio(self.builder.get_object("extract_all")).get_name()
+        files_or_all = self._resolve_radio(w("extract_all")).get_name()
         dialog.hide()
         self.selected_folder = selected_folder
         self.XMI.set_overwrite(self.overwrite)
         self.XMI.set_quiet()
         self.XMI.set_output_folder(selected_folder)
 
-        extract_window = self.builder.get_object("extract_window")
-        self.builder.get_object("extract_window_from_label").set_label("Extracting files from \"{}\"".format(Path(self.file_name).name))
-        extract_text = "Extracting {} to {}"
-        pulse_bar = self.builder.get_object("extract_window_progress_bar")
+        extract_window = w("extract_window")
+        w("extract_window_from_label").set_label("Extracting files from \"{}\"".format(self._basename))
+        pulse_bar = w("extract_window_progress_bar")
 
-        button_quit = self.builder.get_object("extract_window_quit")
-        button_show = self.builder.get_object("extract_window_show")
-        button_show_quit = self.builder.get_object("extract_window_show_quit")
-        button_close = self.builder.get_object("extract_window_close")
+        button_quit = w("extract_window_quit")
+        button_show = w("extract_window_show")
+        button_show_quit = w("extract_window_show_quit")
+        button_close = w("extract_window_close")
         button_quit.set_sensitive(False)
         button_show.set_sensitive(False)
         button_show_quit.set_sensitive(False)
         button_close.set_sensitive(False)
-        extract_to_label = self.builder.get_object("extract_window_to_label")
-        extract_to_label.set_label("")
+        extract_to_label = w("extract_window_to_label")
+        extract_to_label.set_label(EXTRACT_TEMPLATE.format(self._basename, selected_folder))
         pulse_bar.set_fraction(0.0)
+        # One widget-tree realization; the progress callbacks only touch
+        # the label and bar, which queue their own redraws
+        extract_window.show_all()
+
+        opts = {
+            'codepage': self.codepage,
+            'unnum': self.unnum,
+            'force': self.force,
+            'binary': self.binary,
+            'modify': self.modify,
+            'overwrite': self.overwrite,
+            'output_folder': selected_folder,
+        }
 
         if files_or_all == "extract_all":
-            logger.debug("Extracting all contents to {}".format(selected_folder))
-            extract_text = extract_text.format(Path(self.file_name).name, selected_folder)
-
-            extract_to_label.set_label(extract_text)
-            pulse_bar.set_fraction(0.1)
-            extract_window.show_all()
-
-            self.XMI.unload_files()
-            pulse_bar.set_fraction(1.0)
-            extract_to_label.set_label("Extraction completed successfully")
-            button_quit.set_sensitive(True)
-            button_show.set_sensitive(True)
-            button_show_quit.set_sensitive(True)
-            button_close.set_sensitive(True)
-            extract_window.show_all()
-
-            self.update_status("{} files extracted ({})".format(
-                self.XMI.get_num_files(),
-                self.sizeof_fmt(self.XMI.get_total_size())
-                )
-            )
+            logger.debug("Extracting all contents to %s", selected_folder)
+
+            # Multi-dataset archives (tapes) get the same one-dataset-
+            # per-process treatment as selected extraction; single-file
+            # archives fall back to unload_files on a thread
+            files = list(self.XMI.get_files())
+            if len(files) > 1:
+                self._submit_extractions([(f, None) for f in files], opts)
+                self.extract_window = extract_window
+                return
+
+            # unload_files is long running I/O + decode; keep it off the
+            # GTK thread so the progress bar actually pulses
+            self._extract_running = True
+
+            def pulse():
+                if self._extract_running:
+                    pulse_bar.pulse()
+                return self._extract_running
+
+            def done():
+                self._extract_running = False
+                pulse_bar.set_fraction(1.0)
+                extract_to_label.set_label("Extraction completed successfully")
+                button_quit.set_sensitive(True)
+                button_show.set_sensitive(True)
+                button_show_quit.set_sensitive(True)
+                button_close.set_sensitive(True)
+                num_files, total_size = self.get_counts()
+                self.update_status("{} files extracted ({})".format(num_files, sizeof_fmt(total_size)))
+                return False
+
+            def worker():
+                self.XMI.unload_files()
+                GLib.idle_add(done)
+
+            GLib.timeout_add(100, pulse)
+            threading.Thread(target=worker, daemon=True).start()
 
         else:
-            total = 0
-            total_selected = len(selected_items)
-            total_files = 1
-
-            extract_window.show_all()
-
-            for selected in selected_items:
-                filename = selected[0]
-                parent = selected[1]
-
-                extract_text = extract_text.format(filename, selected_folder)
-                extract_to_label.set_label(extract_text)
-                pulse_bar.set_fraction(total_selected/total_files)
-                extract_window.show_all()
-                if not parent:
-                    self.XMI.unload_pds(filename)
-                    num_extracted = len(self.XMI.get_members(filename)) if len(self.XMI.get_members(filename)) > 0 else 1
-                    extracted = "{} files extracted ({})".format(total, self.sizeof_fmt(self.XMI.get_dataset_size(filename)))
-                    total += num_extracted
-                    logger.debug(extracted)
-                    total_files += 1
-                else:
-                    total += 1
-                    self.XMI.unload_file(parent, filename)
-                    plural = 'files' if total > 1 else 'file'
-                    extracted = "{} {} extracted ({})".format(total, plural, self.sizeof_fmt(self.XMI.get_member_size(parent, filename)))
-                    logger.debug(extracted)
-                    total_files += 1
+            self._submit_extractions(selected_items, opts)
+        self.extract_window = extract_window
 
+    def _submit_extractions(self, items, opts):
+        # Fan the work out to worker processes; the codec conversion is
+        # CPU bound so this scales with cores instead of blocking the
+        # main loop. Each worker re-parses the archive, so members are
+        # grouped by parent dataset for one parse per dataset rather
+        # than one per member
+        datasets = []
+        members = {}
+        for filename, parent in items:
+            if parent:
+                members.setdefault(parent, []).append(filename)
+            else:
+                datasets.append(filename)
+        jobs = [(None, f) for f in datasets]
+        jobs += [(parent, names) for parent, names in members.items()]
+
+        # A fresh batch invalidates the callbacks of any still-running
+        # one so late completions can't corrupt the new counters
+        self._extract_generation += 1
+        generation = self._extract_generation
+        self._extract_selected = len(jobs)
+        self._extract_finished = 0
+        self._extract_total = 0
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count())
+        for parent, filenames in jobs:
+            logger.debug("Submitting %s (parent: %s) for extraction", filenames, parent)
+            future = executor.submit(_extract_one, self.file_name, opts, parent, filenames)
+            # done callbacks fire on a pool thread, so bounce back to
+            # the GTK thread before touching any widget
+            future.add_done_callback(
+                    lambda f: GLib.idle_add(self._on_extract_done, f, generation))
+        executor.shutdown(wait=False)
+
+    def _on_extract_done(self, future, generation):
+        if generation != self._extract_generation:
+            return False
+        try:
+            self._extract_total += future.result()
+        except Exception as err:
+            logger.error("Extraction failed: %s", err)
+        self._extract_finished += 1
+        pulse_bar = self._widget("extract_window_progress_bar")
+        pulse_bar.set_fraction(self._extract_finished / self._extract_selected)
+        plural = 'files' if self._extract_total != 1 else 'file'
+        extracted = "{} {} extracted".format(self._extract_total, plural)
+        logger.debug(extracted)
+        if self._extract_finished == self._extract_selected:
             self.update_status(extracted)
-            extract_to_label.set_label("Extraction completed successfully")
-            button_quit.set_sensitive(True)
-            button_show.set_sensitive(True)
-            button_show_quit.set_sensitive(True)
-            button_close.set_sensitive(True)
-            extract_window.show_all()
-        self.extract_window = extract_window
+            self._widget("extract_window_to_label").set_label("Extraction completed successfully")
+            for name in ("extract_window_quit", "extract_window_show",
+                         "extract_window_show_quit", "extract_window_close"):
+                self._widget(name).set_sensitive(True)
+        return False
 
     def extract_and_open(self, member, pds):
-        logger.debug("Opening {}".format(member))
+        logger.debug("Opening %s", member)
         if pds:
             info = self.XMI.get_member_info(pds, member)
-            file_data = self.XMI.get_member_decoded(pds, member)
-
         else:
-            info = self.XMI.get_file_info_simple(member)
-            file_data = self.XMI.get_seq_decoded(member)
+            info = self._info(member)
+        file_data = self._decoded(pds, member)
 
-        #member_exec = self.mime_exec(info['mimetype'])
-        logger.debug("Opening {} with default app".format(member))
+        #member_exec = mime_exec(info['mimetype'])
+        logger.debug("Opening %s with default app", member)
         giotype = Gio.content_type_from_mime_type(info['mimetype'])
         #default_app = Gio.app_info_get_all_for_type(info['mimetype'])[0]
         extract_folder = self.make_temp_folder()
         target = "{}/{}{}".format(extract_folder, member ,info['extension'])
 
-        logger.debug("Extracting temp file to: {}".format(target))
+        logger.debug("Extracting temp file to: %s", target)
 
-        with open(target, 'wb') as extract_member:
-            if isinstance(file_data, str):
-                extract_member.write(file_data.encode('utf-8'))
-            else:
-                extract_member.write(file_data)
+        # One write(2) of the whole payload instead of the buffered IO
+        # layer's 8 KiB chunks
+        payload = file_data.encode('utf-8') if isinstance(file_data, str) else file_data
+        fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            # write(2) can come up short (and caps out around 2 GB per
+            # call), so keep writing until the payload is flushed
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
 
         member_gfile = Gio.File.new_for_path(target)
         uri = member_gfile.get_uri()
@@ -609,7 +932,7 @@ class XMIssion:
             self.overwrite = False
         else:
             self.overwrite = True
-        logger.debug("Overwrite set to {}".format(self.overwrite))
+        logger.debug("Overwrite set to %s", self.overwrite)
 
     def toggle_unnum(self, toggle):
         if self.unnum:
@@ -618,7 +941,7 @@ class XMIssion:
         else:
             self.unnum = True
             self.update_status("UnNum enabled")
-        logger.debug("UnNum set to {}".format(self.unnum))
+        logger.debug("UnNum set to %s", self.unnum)
         self.refresh_file()
 
     def toggle_modify(self, toggle):
@@ -628,7 +951,7 @@ class XMIssion:
         else:
             self.modify = True
             self.update_status("Modify Date enabled")
-        logger.debug("Modify Date set to {}".format(self.modify))
+        logger.debug("Modify Date set to %s", self.modify)
         self.XMI.set_modify(self.modify)
 
     def set_folder(self, toggle):
@@ -636,7 +959,7 @@ class XMIssion:
             self.make_folder = False
         else:
             self.make_folder = True
-        logger.debug("Make folder set to {}".format(self.make_folder))
+        logger.debug("Make folder set to %s", self.make_folder)
 
     def _resolve_radio(self, master_radio):
         active = next((
@@ -647,28 +970,34 @@ class XMIssion:
         return active
 
     def get_selected(self):
-        (model, pathlist) = self.builder.get_object('file_selection').get_selected_rows()
-        selected = []
-        for path in pathlist :
-            tree_iter = model.get_iter(path)
-            filename = model.get_value(tree_iter,6)
-            pds = model.get_value(tree_iter,7)
-            selected.append((filename, pds))
-        return(selected)
+        (model, pathlist) = self._widget('file_selection').get_selected_rows()
+        # model.get fetches both columns in one C call instead of two
+        # get_value round trips; bind the methods once outside the loop
+        get_iter = model.get_iter
+        get = model.get
+        return [get(get_iter(path), 6, 7) for path in pathlist]
 
     # callback function for the dialog open_dialog
     def open_response(self, dialog, response_id):
         open_dialog = dialog
         # if response is "ACCEPT" (the button "Open" has been clicked)
         if response_id == Gtk.ResponseType.OK:
-            selected_file = open_dialog.get_file()
-            try:
-                [success, self.file_data, etags] = selected_file.load_contents(None)
-            except GObject.GError as e:
-                logger.error("Error: " + e.message)
-            # set the content as the text into the buffer
             self.file_name = open_dialog.get_filename()
-            logger.debug("File opened: " + self.file_name)
+            try:
+                if self.file_name is not None:
+                    # map the file rather than pulling every byte into
+                    # RAM (load_contents reads it all)
+                    self.file_data = self._map_file(self.file_name)
+                else:
+                    # the chooser allows non-local files, which have no
+                    # path to mmap; pull those through GIO instead
+                    gfile = open_dialog.get_file()
+                    self.file_name = gfile.get_uri()
+                    self.file_data = gfile.load_contents(None)[1]
+                    self._file_mtime = time.time()
+            except (OSError, GLib.Error) as e:
+                logger.error("Error: %s", e)
+            logger.debug("File opened: %s", self.file_name)
             dialog.destroy()
             try:
                 #self.load_file()
@@ -676,7 +1005,7 @@ class XMIssion:
             except Exception as err:
                 logger.debug(err)
                 message = "Error Opening {}"
-                self.err_window.set_property("text",message.format(Path(self.file_name).name))
+                self.err_window.set_property("text",message.format(self._basename))
                 self.err_window.set_property("secondary_text","Error: {}".format(err))
                 self.err_window.set_transient_for(self.main_window)
                 self.err_window.show()
@@ -697,7 +1026,7 @@ class XMIssion:
 
     def right_click_open(self, button):
         for selected in self.get_selected():
-            logger.debug("Opening {}".format(selected))
+            logger.debug("Opening %s", selected)
 
             filename = selected[0]
             parent = selected[1]
@@ -708,7 +1037,7 @@ class XMIssion:
         for selected in self.get_selected():
             filename = selected[0]
             parent = selected[1]
-            logger.debug("Filename: {} Parent: {}".format(filename, parent))
+            logger.debug("Filename: %s Parent: %s", filename, parent)
 
             if not parent:
                 # Show file info
@@ -716,62 +1045,62 @@ class XMIssion:
                     self.show_info(None)
                     continue
                 info = self.XMI.get_file_info_detailed(filename)
-                img = self.mime_icon(info['mimetype'], size=64)
-                desc = self.mime_desc(info['mimetype'])
-                self.member_window = self.builder.get_object('tape_file_info_window')
-                self.builder.get_object("tape_file_icon").set_from_pixbuf(img)
+                img = mime_icon(info['mimetype'], size=64)
+                desc = mime_desc(info['mimetype'])
+                self.member_window = self._widget('tape_file_info_window')
+                self.w_tape_file_icon.set_from_pixbuf(img)
                 if info['extension']:
-                    self.builder.get_object("tape_file_info_name").set_text("{}{}".format(filename, info['extension']))
+                    self.w_tape_file_info_name.set_text("{}{}".format(filename, info['extension']))
                 else:
-                    self.builder.get_object("tape_file_info_name").set_text(filename)
-                self.builder.get_object("tape_file_info_type").set_text(desc)
-                self.builder.get_object("tape_file_info_created").set_text(info['created'])
-                self.builder.get_object("tape_file_info_expires").set_text(info['expires'])
-                self.builder.get_object("tape_file_info_system_code").set_text(info['syscode'])
-                self.builder.get_object("tape_file_info_job_id").set_text(info['jobid'])
-                self.builder.get_object("tape_file_info_size").set_text(self.sizeof_fmt(info['size']))
+                    self.w_tape_file_info_name.set_text(filename)
+                self.w_tape_file_info_type.set_text(desc)
+                self.w_tape_file_info_created.set_text(info['created'])
+                self.w_tape_file_info_expires.set_text(info['expires'])
+                self.w_tape_file_info_system_code.set_text(info['syscode'])
+                self.w_tape_file_info_job_id.set_text(info['jobid'])
+                self.w_tape_file_info_size.set_text(sizeof_fmt(info['size']))
                 total = len(self.XMI.get_members(filename))
                 if total > 0:
-                    self.builder.get_object("tape_file_info_num_files").set_text(str(total))
+                    self.w_tape_file_info_num_files.set_text(str(total))
                 else:
-                    self.builder.get_object("tape_file_info_num_files").set_text("1")
-                self.builder.get_object("tape_file_info_lrecl").set_text(str(info['LRECL']))
-                self.builder.get_object("tape_file_info_recfm").set_text(info['RECFM'])
-                self.builder.get_object("tape_file_info_owner").set_text(info['owner'])
-                self.builder.get_object("tape_file_info_user_label").set_text(self.XMI.get_user_label())
+                    self.w_tape_file_info_num_files.set_text("1")
+                self.w_tape_file_info_lrecl.set_text(str(info['LRECL']))
+                self.w_tape_file_info_recfm.set_text(info['RECFM'])
+                self.w_tape_file_info_owner.set_text(info['owner'])
+                self.w_tape_file_info_user_label.set_text(self.XMI.get_user_label())
             else:
 
-                self.member_window = self.builder.get_object('member_info_window')
+                self.member_window = self._widget('member_info_window')
                 member = filename
                 info = self.XMI.get_member_info(parent, member)
-                img = self.mime_icon(info['mimetype'], size=64)
-                desc = self.mime_desc(info['mimetype'])
+                img = mime_icon(info['mimetype'], size=64)
+                desc = mime_desc(info['mimetype'])
 
                 if 'alias' in info:
-                    self.builder.get_object("member_alias").set_text(info['alias'])
+                    self.w_member_alias.set_text(info['alias'])
                 else:
-                    self.builder.get_object("member_alias").set_text("N/A")
+                    self.w_member_alias.set_text("N/A")
 
-                self.builder.get_object("member_icon").set_from_pixbuf(img)
-                self.builder.get_object("member_info").set_text(member)
-                self.builder.get_object("member_recfm").set_text(info['RECFM'])
-                self.builder.get_object("member_lrecl").set_text(str(info['LRECL']))
-                self.builder.get_object("member_type").set_text(desc)
-                self.builder.get_object("member_siz").set_text(self.sizeof_fmt(info['size']))
+                self.w_member_icon.set_from_pixbuf(img)
+                self.w_member_info.set_text(member)
+                self.w_member_recfm.set_text(info['RECFM'])
+                self.w_member_lrecl.set_text(str(info['LRECL']))
+                self.w_member_type.set_text(desc)
+                self.w_member_siz.set_text(sizeof_fmt(info['size']))
 
 
                 if 'modified' in info:
-                    modified = datetime.datetime.fromisoformat(info['modified']).strftime("%-d %B %Y, %H:%S")
-                    created = datetime.datetime.fromisoformat(info['created']).strftime("%-d %B %Y, %H:%S")
-                    self.builder.get_object("member_modified").set_text(modified)
-                    self.builder.get_object("member_owner").set_text(info['owner'])
-                    self.builder.get_object("member_created").set_text(created)
-                    self.builder.get_object("member_version").set_text(info['version'])
+                    modified = _fmt_iso(info['modified'])
+                    created = _fmt_iso(info['created'])
+                    self.w_member_modified.set_text(modified)
+                    self.w_member_owner.set_text(info['owner'])
+                    self.w_member_created.set_text(created)
+                    self.w_member_version.set_text(info['version'])
                 else:
-                    self.builder.get_object("member_modified").set_text('N/A')
-                    self.builder.get_object("member_owner").set_text('N/A')
-                    self.builder.get_object("member_created").set_text('N/A')
-                    self.builder.get_object("member_version").set_text('N/A')
+                    self.w_member_modified.set_text('N/A')
+                    self.w_member_owner.set_text('N/A')
+                    self.w_member_created.set_text('N/A')
+                    self.w_member_version.set_text('N/A')
 
 
             self.member_window.set_transient_for(self.main_window)
@@ -784,29 +1113,45 @@ class XMIssion:
 
     def right_click_extract(self, button):
         logger.debug("Right Click Extract")
-        self.builder.get_object("extract_selected").set_active(True)
+        self._widget("extract_selected").set_active(True)
         self.extract(button)
 
     def refresh_file(self):
         # this function gets called if someone changes the settings
         # - disabled UnNum
         # - changes code-page
-        if self.file_data:
-            logger.debug("Reloading data")
-            self.loading_file()
-        else:
+        if not self.file_data:
             logger.debug("No data to refresh")
+            return
+        # Flipping a setting back and forth, or toggling one that the
+        # current archive doesn't care about, shouldn't trigger a full
+        # re-parse
+        signature = (self.unnum, self.codepage, self.binary, self.force)
+        if signature == self._settings_signature:
+            logger.debug("Settings unchanged, skipping reload")
+            return
+        logger.debug("Reloading data")
+        self.loading_file()
 
     def load_tape_file(self, update_status=True):
-        logger.debug("Parsing Virtual Tape file {}".format(self.file_name))
+        logger.debug("Parsing Virtual Tape file %s", self.file_name)
         self.file_store_treeview.clear()
 
 
     def load_file(self, update_status=True):
-        logger.debug("Parsing XMI file {}".format(self.file_name))
-        self.file_store_treeview.clear()
+        """Parse the archive and stage the file list rows.
+
+        Runs on the loading worker thread: everything here is parsing
+        and row preparation, no widget access. The GTK side (clearing
+        and refilling the store, sensitizing menus) happens afterwards
+        in _apply_rows on the main loop.
+        """
+        logger.debug("Parsing XMI file %s", self.file_name)
 
         # Get a new object
+        self._info_cache.clear()
+        self._decode_cache.clear()
+        self._counts = None
         self.XMI = xmi.XMIT(loglevel=self.loglevel,
                 unnum=self.unnum, encoding=self.codepage,
                 binary=self.binary, force_convert=self.force
@@ -814,131 +1159,261 @@ class XMIssion:
 
         self.XMI.set_filename(self.file_name)
         self.XMI.set_file_object(self.file_data)
+        # Released xmi versions have no progress hook; when one is
+        # available, drive the loading bar with real fractions instead
+        # of the indeterminate pulse
+        set_progress = getattr(self.XMI, 'set_progress_callback', None)
+        if set_progress is not None and self.progress_bar is not None:
+            set_progress(self._report_progress)
         try:
             self.XMI.open()
         except Exception as err:
             logger.debug(err)
-            message = "Error opening \"{}\""
-            self.err_window.set_property("text",message.format(Path(self.file_name).name))
-            self.err_window.set_property("secondary_text","{}".format(err))
-            self.err_window.set_transient_for(self.main_window)
-            self.err_window.show()
-            self.err_window.run()
-            self.err_window.hide()
-            self.stop_progress(None)
+            GLib.idle_add(self._show_open_error, err)
             return
 
-        for f in self.XMI.get_files():
-            info = self.XMI.get_file_info_simple(f)
-            self.list_store_append(f, info)
+        # Remember which settings produced this parse so refresh_file
+        # can skip reloads that wouldn't change anything
+        self._settings_signature = (self.unnum, self.codepage,
+                                    self.binary, self.force)
+
+        rows = [(f, self._info(f)) for f in self.XMI.get_files()]
+        GLib.idle_add(self._apply_rows, rows, update_status)
+
+    def _show_open_error(self, err):
+        message = "Error opening \"{}\""
+        # _basename isn't set yet if the file couldn't even be read
+        self.err_window.set_property("text",message.format(self._basename or self.file_name))
+        self.err_window.set_property("secondary_text","{}".format(err))
+        self.err_window.set_transient_for(self.main_window)
+        self.err_window.show()
+        self.err_window.run()
+        self.err_window.hide()
+        self.stop_progress()
+        return False
+
+    def _apply_rows(self, rows, update_status=True):
+        # Main loop side of load_file: same trick as go_home and
+        # double_click, detach the model and disable sorting so the
+        # whole batch goes in without a resort or row-changed signal
+        # per append
+        self._fill_generation += 1
+        w = self._widget
+        store = self.file_store_treeview
+        treeview = w('file_selection').get_tree_view()
+        sort_settings = store.get_sort_column_id()
+        treeview.set_model(None)
+        store.set_default_sort_func(lambda *args: 0)
+        store.set_sort_column_id(Gtk.TREE_SORTABLE_UNSORTED_SORT_COLUMN_ID, Gtk.SortType.ASCENDING)
+        try:
+            store.clear()
+            for f, info in rows:
+                self.list_store_append(f, info)
+        finally:
+            if sort_settings[0] is not None:
+                store.set_sort_column_id(*sort_settings)
+            treeview.set_model(store)
+
+        # Classify the archive once so later consumers don't have to
+        # re-inspect the filename. The extension settles it with two
+        # short compares; only oddly named files fall back to scanning
+        # the whole basename
+        ext = self._path.suffix.lower()
+        if ext == ".aws":
+            self._archive_kind = "AWS Virtual Tape"
+        elif ext == ".het":
+            self._archive_kind = "HET Virtual Tape"
+        else:
+            upper_name = self._basename.upper()
+            if "AWS" in upper_name:
+                self._archive_kind = "AWS Virtual Tape"
+            elif "HET" in upper_name:
+                self._archive_kind = "HET Virtual Tape"
+            else:
+                self._archive_kind = "Unknown"
 
         self.fill_info_window()
 
-        if self.XMI.has_message():
-            logger.debug("{} has message".format(self.file_name))
-            self.msg_button.set_sensitive(True)
-            self.builder.get_object("file_message_menu").set_sensitive(True)
-            self.builder.get_object("info_messages").set_text("Yes")
-        else:
-            self.msg_button.set_sensitive(False)
-            self.builder.get_object("file_message_menu").set_sensitive(True)
-            self.builder.get_object("info_messages").set_text("No")
+        has_msg = self.XMI.has_message()
+        if has_msg:
+            logger.debug("%s has message", self.file_name)
+        # The menu entry is sensitive either way; only the toolbar
+        # button and the info field depend on the message
+        w("file_message_menu").set_sensitive(True)
+        self.msg_button.set_sensitive(has_msg)
+        self.w_info_messages.set_text("Yes" if has_msg else "No")
 
-        self.builder.get_object("file_extract").set_sensitive(True)
-        self.update_location()
+        w("file_extract").set_sensitive(True)
 
-        self.main_window.set_title(Path(self.file_name).name)
+        w("file_info").set_sensitive(True)
+        w("file_info_menu").set_sensitive(True)
 
-        self.builder.get_object("file_info").set_sensitive(True)
-        self.builder.get_object("file_info_menu").set_sensitive(True)
+        w("location_go_up").set_sensitive(True)
+        w("location_go_home").set_sensitive(True)
 
-        self.builder.get_object("location_go_up").set_sensitive(True)
-        self.builder.get_object("location_go_home").set_sensitive(True)
+        self.update_location()
+
+        self.main_window.set_title(self._basename)
 
         if update_status:
-            self.update_status("{} objects ({})".format(self.XMI.get_num_files(), self.sizeof_fmt(self.XMI.get_total_size())))
+            num_files, total_size = self.get_counts()
+            self.update_status(f"{num_files} objects ({sizeof_fmt(total_size)})")
 
     def fill_info_window(self):
+        # Hoist the Path lookups, they'd otherwise repeat for every
+        # field below
+        name = self._basename
+        location = self._parent_abs
 
         if self.XMI.has_xmi():
             filename = self.XMI.get_file()
-            info = self.XMI.get_file_info_simple(filename)
+            info = self._info(filename)
             node_info = self.XMI.get_xmi_node_user()
-
-            self.builder.get_object("info_filename").set_text(Path(self.file_name).name)
-            self.builder.get_object("info_location").set_text(str(Path(self.file_name).parent.absolute()))
-            self.builder.get_object("info_created").set_text(info['modified'])
-            self.builder.get_object("info_pds").set_text(self.XMI.get_files()[0])
-            self.builder.get_object("info_size").set_text(self.sizeof_fmt(len(self.file_data)))
-            self.builder.get_object("info_num_files").set_text(str(self.XMI.get_num_files()))
-            self.builder.get_object("info_from_node").set_text(node_info[0])
-            self.builder.get_object("info_from_user").set_text(node_info[1])
-            self.builder.get_object("info_to_node").set_text(node_info[2])
-            self.builder.get_object("info_to_user").set_text(node_info[3])
-            if self.XMI.is_pds(self.XMI.get_files()[0]):
-                self.builder.get_object("info_type").set_text("PDS")
-            else:
-                self.builder.get_object("info_type").set_text("Sequential")
+            # get_files() walks the parsed archive; do it once for
+            # both the PDS name and the type check below
+            first_file = self.XMI.get_files()[0]
+
+            pairs = (
+                (self.w_info_filename, name),
+                (self.w_info_location, location),
+                (self.w_info_created, info['modified']),
+                (self.w_info_pds, first_file),
+                (self.w_info_size, sizeof_fmt(len(self.file_data))),
+                (self.w_info_num_files, str(self.XMI.get_num_files())),
+                (self.w_info_from_node, node_info[0]),
+                (self.w_info_from_user, node_info[1]),
+                (self.w_info_to_node, node_info[2]),
+                (self.w_info_to_user, node_info[3]),
+                (self.w_info_type,
+                 "PDS" if self.XMI.is_pds(first_file) else "Sequential"),
+            )
         else:
-            self.builder.get_object("tape_info_filename").set_text(Path(self.file_name).name)
-            self.builder.get_object("tape_info_location").set_text(str(Path(self.file_name).parent.absolute()))
-            self.builder.get_object("tape_info_size").set_text(self.sizeof_fmt(len(self.file_data)))
-            if "AWS" in Path(self.file_name).name.upper():
-                self.builder.get_object("tape_info_type").set_text("AWS Virtual Tape")
-            if "HET" in Path(self.file_name).name.upper():
-                self.builder.get_object("tape_info_type").set_text("HET Virtual Tape")
-            self.builder.get_object("tape_info_num_files").set_text(str(self.XMI.get_num_files()))
-            self.builder.get_object("tape_info_owner").set_text(self.XMI.get_owner())
-            self.builder.get_object("tape_info_volume").set_text(self.XMI.get_volser())
-            created = datetime.datetime.fromtimestamp(Path(self.file_name).lstat().st_mtime).isoformat()
-            self.builder.get_object("tape_info_created").set_text(created)
+            # mtime was recorded when the file was read, no need to
+            # stat it again
+            created = time.strftime("%Y-%m-%dT%H:%M:%S",
+                                    time.localtime(self._file_mtime))
+            pairs = (
+                (self.w_tape_info_filename, name),
+                (self.w_tape_info_location, location),
+                (self.w_tape_info_size, sizeof_fmt(len(self.file_data))),
+                (self.w_tape_info_type, self._archive_kind),
+                (self.w_tape_info_num_files, str(self.XMI.get_num_files())),
+                (self.w_tape_info_owner, self.XMI.get_owner()),
+                (self.w_tape_info_volume, self.XMI.get_volser()),
+                (self.w_tape_info_created, created),
+            )
+        for widget, value in pairs:
+            widget.set_text(value)
 
 
     def go_home(self, button):
-        self.file_store_treeview.clear()
-        for f in self.XMI.get_files():
-            info = self.XMI.get_file_info_simple(f)
-            self.list_store_append(f, info)
+        treeview = self._widget('file_selection').get_tree_view()
+        model = self.file_store_treeview
+        sort_settings = model.get_sort_column_id()
+        # Detach the model and disable sorting so the treeview doesn't
+        # resort and redraw on every single append
+        treeview.set_model(None)
+        model.set_default_sort_func(lambda *args: 0)
+        model.set_sort_column_id(Gtk.TREE_SORTABLE_UNSORTED_SORT_COLUMN_ID, Gtk.SortType.ASCENDING)
+        model.clear()
+        # Sort once in Python rather than letting the model reorder
+        # itself on every insert
+        files = sorted(self.XMI.get_files(), key=self.natural_key)
+
+        self._fill_generation += 1
+        generation = self._fill_generation
+
+        # Append in batches scheduled on the main loop so the window
+        # keeps repainting while a huge archive is listed
+        def pump(start):
+            # Another fill started since this batch was scheduled;
+            # appending now would duplicate rows in the new view
+            if generation != self._fill_generation:
+                return False
+            end = min(start + LIST_BATCH_SIZE, len(files))
+            for f in files[start:end]:
+                self.list_store_append(f, self._info(f))
+            if end < len(files):
+                GLib.idle_add(pump, end, priority=GLib.PRIORITY_DEFAULT_IDLE)
+            else:
+                if sort_settings[0] is not None:
+                    model.set_sort_column_id(*sort_settings)
+                treeview.set_model(model)
+                num_files, total_size = self.get_counts()
+                self.update_status(f"{num_files} objects ({sizeof_fmt(total_size)})")
+            return False
+
+        GLib.idle_add(pump, 0, priority=GLib.PRIORITY_DEFAULT_IDLE)
         self.update_location()
-        self.update_status("{} objects ({})".format(self.XMI.get_num_files(), self.sizeof_fmt(self.XMI.get_total_size())))
 
 
     def update_location(self, location="/"):
-        location_box = self.builder.get_object("location_bar")
+        location_box = self._widget("location_bar")
         location_box.set_text(location)
 
-    def sizeof_fmt(self, num):
-        for unit in ['bytes','kB','MB','GB','TB','PB','EB','ZB']:
-            if abs(num) < 1024.0:
-                return "{:3.1f} {}".format(num, unit)
-            num /= 1024.0
-        return "{:.1f}{}".format(num, 'YB')
-
-    def natural_key(self, string_):
+    @staticmethod
+    def natural_key(string_):
         """See https://blog.codinghorror.com/sorting-for-humans-natural-sort-order/"""
-        return [int(s) if s.isdigit() else s for s in re.split(r'(\d+)', string_)]
+        # Most member names are pure letters (IEFBR14 aside); skip the
+        # regex split for those
+        if string_.isalpha():
+            return (sys.intern(string_) if len(string_) < 64 else string_,)
+        # Interning makes equal fragments ("SYS1", "LOAD", ...) compare
+        # by pointer during the sort; cap the length so pathological
+        # names don't pin big strings forever
+        return tuple(int(s) if s.isdigit()
+                     else (sys.intern(s) if len(s) < 64 else s)
+                     for s in _nat_split(string_))
 
     #THREADS >:(
 
     def loading_file(self):
-        self.working_window = self.builder.get_object("loading_file_window")
-        self.builder.get_object("loading_file_label").set_text("Loading: {}".format(Path(self.file_name).name))
-        self.builder.get_object("loading_file_size").set_text("File Size: {}".format(self.sizeof_fmt(len(self.file_data))))
-        self.progress_bar = self.builder.get_object("loading_file_bar")
-        self.update_status("Loading... {} ({})".format(self.file_name, self.sizeof_fmt(len(self.file_data))))
+        # Build the Path once per load; everything downstream reuses
+        # the precomputed strings
+        self._path = Path(self.file_name)
+        self._basename = self._path.name
+        self._parent_abs = str(self._path.parent.absolute())
+        # Small files parse faster than the loading window can even
+        # paint; skip the window, worker thread and pulse timer
+        if len(self.file_data) < 1 << 20:
+            self.load_file()
+            return
+        self.working_window = self._widget("loading_file_window")
+        self._widget("loading_file_label").set_text("Loading: {}".format(self._basename))
+        self._widget("loading_file_size").set_text("File Size: {}".format(sizeof_fmt(len(self.file_data))))
+        self.progress_bar = self._widget("loading_file_bar")
+        self.update_status("Loading... {} ({})".format(self.file_name, sizeof_fmt(len(self.file_data))))
         self.working_window.show_all()
         self.working_window.set_keep_above(True)
-        self.work_thread = threading.Thread(target=self.run_thread)
         self.running = True
+        self._progress_hooked = False
         GLib.timeout_add(200, self.update_progress)
-        self.work_thread.daemon = True
-        self.work_thread.start()
+        self._load_queue.put(self.run_thread)
 
     def update_progress(self):
-        if self.running:
+        # Once the parser reports real fractions the pulse would fight
+        # with set_fraction, so the timer backs off to a no-op
+        if self.running and not self._progress_hooked:
             self.progress_bar.pulse()
         return self.running
 
+    def _report_progress(self, fraction):
+        # Called from the loading thread by the parser, if this xmi
+        # version supports progress callbacks
+        self._progress_hooked = True
+        GLib.idle_add(self.progress_bar.set_fraction, fraction)
+
+    # daemon loop serving the load queue, one job at a time
+    def _load_worker(self):
+        while True:
+            job = self._load_queue.get()
+            try:
+                job()
+            except Exception as err:
+                logger.error("Loader job failed: %s", err)
+            finally:
+                self._load_queue.task_done()
+
     # this will get run in a separate thread
     def run_thread(self):
 
@@ -949,17 +1424,24 @@ class XMIssion:
     # this will get run in the GUI thread when the worker thread is done
     def stop_progress(self):
         self.running = False
-        self.work_thread.join()
-        self.working_window.hide()
+        if self.working_window is not None:
+            self.working_window.hide()
 
 
 logger.setLevel(logging.WARNING)
 
-desc = 'XMIssion: XMI and Virtual Tape (AWS/HET) File Manager'
-arg_parser = argparse.ArgumentParser(description=desc)
-arg_parser.add_argument('-d', '--debug', help="Print debugging statements", action="store_const", dest="loglevel", const=logging.DEBUG, default=logging.WARNING)
-arg_parser.add_argument("filename", help="xmi/het/aws to extract", nargs="?", default=None)
-args = arg_parser.parse_args()
 
-app = XMIssion(loglevel=args.loglevel, filename=args.filename)
-Gtk.main()
\ No newline at end of file
+def main():
+    import argparse
+    desc = 'XMIssion: XMI and Virtual Tape (AWS/HET) File Manager'
+    arg_parser = argparse.ArgumentParser(description=desc)
+    arg_parser.add_argument('-d', '--debug', help="Print debugging statements", action="store_const", dest="loglevel", const=logging.DEBUG, default=logging.WARNING)
+    arg_parser.add_argument("filename", help="xmi/het/aws to extract", nargs="?", default=None)
+    args = arg_parser.parse_args()
+
+    app = XMIssion(loglevel=args.loglevel, filename=args.filename)
+    Gtk.main()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file